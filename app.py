@@ -1,10 +1,9 @@
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
-from data import load_clean
+from data import load_clean, data_version
 from pd_model import build_pd
-from ecl import add_ecl, aggregate
+from ecl import add_ecl
 from ai import get_insight
 from config import set_api_key, get_api_key
 from auth import ensure_default_users, verify_login, create_user, list_users, update_segments
@@ -17,6 +16,7 @@ from storage import (
     update_insight,
     list_reports_for_user,
 )
+from view_cache import ViewCache, view_key, build_view
 
 st.set_page_config(page_title="ECL Dashboard", layout="centered")
 st.set_option("client.showErrorDetails", False)
@@ -35,14 +35,24 @@ def _format_label(val: str) -> str:
     return s.title()
 
 
-@st.cache_data(show_spinner=False)
-def run_model_and_metrics() -> pd.DataFrame:
-    df = load_clean("loan_data.csv")
+DATA_PATH = "loan_data.csv"
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def run_model_and_metrics(version: str) -> pd.DataFrame:
+    # `version` is only the cache key: a changed CSV gets a fresh entry
+    df = load_clean(DATA_PATH)
     df["pd"] = build_pd(df)
     df = add_ecl(df)
     return df
 
 
+@st.cache_resource(show_spinner=False)
+def get_view_cache() -> ViewCache:
+    # Shared across sessions; views are keyed by selection, entitlements and data version
+    return ViewCache(max_entries=64)
+
+
 def action_rule(ecl: float, med: float) -> str:
     if ecl > 1.5 * med:
         return "Reduce disbursement"
@@ -100,7 +110,8 @@ def main():
         del st.session_state["user"]
         st.rerun()
 
-    df = run_model_and_metrics()
+    version = data_version(DATA_PATH)
+    df = run_model_and_metrics(version)
 
     intents = sorted(df["loan_intent"].unique().tolist())
     genders = sorted(df["person_gender"].unique().tolist())
@@ -114,16 +125,27 @@ def main():
     # Empty by default; users decide what to add
     sel_intent = st.sidebar.multiselect("Loan Intent", intents_allowed, default=[], format_func=_format_label)
     sel_gender = st.sidebar.multiselect("Gender", genders_allowed, default=[], format_func=_format_label)
+    cache_caption = st.sidebar.empty()
+
+    def _show_cache_stats():
+        if user["role"] == "cro":
+            cs = get_view_cache().stats()
+            cache_caption.caption(f"View cache: {cs['hits']} hits / {cs['misses']} misses ({cs['size']}/{cs['max_entries']} entries)")
+
+    _show_cache_stats()
 
     if not sel_intent or not sel_gender:
         st.info("Select loan intent and gender to see ECL results.")
         return
-    f = df[df["loan_intent"].isin(sel_intent) & df["person_gender"].isin(sel_gender)]
-    if f.empty:
+    key = view_key(sel_intent, sel_gender, intents_allowed, genders_allowed, version)
+    view = get_view_cache().get_or_build(key, lambda: build_view(df, sel_intent, sel_gender))
+    _show_cache_stats()
+    if view is None:
         st.warning("No data for current selections.")
         return
 
-    g, med = aggregate(f)
+    # Cached views are shared across sessions; work on a private copy
+    g, med = view["summary"].copy(), view["median"]
 
     st.subheader("Summary")
     st.dataframe(g.round({"pd_mean": 4, "lgd": 3, "ecl": 2}))
@@ -143,13 +165,7 @@ def main():
             st.success(f"Insight saved: {iid}")
 
     st.subheader("ECL by Gender")
-    by_gender = f.groupby("person_gender")["ecl"].sum()
-    fig, ax = plt.subplots(figsize=(5, 3))
-    ax.bar(by_gender.index.astype(str), by_gender.values, color="#4c72b0")
-    ax.set_ylabel("ECL")
-    ax.set_xlabel("Gender")
-    ax.set_title("ECL by Gender")
-    st.pyplot(fig, clear_figure=True)
+    st.image(view["chart_png"], use_column_width=True)
 
     st.subheader("AI Insight")
     # Settings for API key (only show if no key stored)
@@ -1,6 +1,18 @@
+import os
 import pandas as pd
 
 
+def data_version(path: str) -> str:
+    # Changes whenever the source file is replaced or edited. Read before
+    # load_clean, so a file swapped in between is cached under the old version
+    # for one rerun; the next rerun sees the new version and reloads.
+    try:
+        info = os.stat(path)
+    except OSError:
+        return ""
+    return f"{info.st_mtime_ns}-{info.st_size}"
+
+
 def load_clean(path: str) -> pd.DataFrame:
     df = pd.read_csv(path)
     df = df.drop_duplicates()
@@ -0,0 +1,88 @@
+import io
+import threading
+from collections import OrderedDict
+
+from matplotlib.figure import Figure
+import pandas as pd
+
+from ecl import aggregate
+
+
+class ViewCache:
+    """Bounded LRU cache of rendered dashboard views.
+
+    Entries are keyed by the filter selection, the user's entitlements and the
+    dataset version, so reruns triggered by unrelated widgets reuse the
+    summary frame and pre-rendered chart instead of rebuilding them.
+
+    Cached views are shared by every session without copying, so callers must
+    not mutate them; copy the summary frame before editing it.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        view = build()
+        with self._lock:
+            self._entries[key] = view
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return view
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "max_entries": self.max_entries}
+
+
+def view_key(sel_intent, sel_gender, intents_allowed, genders_allowed, version: str) -> tuple:
+    return (
+        tuple(sorted(map(str, sel_intent))),
+        tuple(sorted(map(str, sel_gender))),
+        tuple(sorted(map(str, intents_allowed))),
+        tuple(sorted(map(str, genders_allowed))),
+        str(version),
+    )
+
+
+def _render_gender_chart(f: pd.DataFrame) -> bytes:
+    by_gender = f.groupby("person_gender")["ecl"].sum()
+    # Figure directly (not pyplot) so rendering is safe across session threads
+    fig = Figure(figsize=(5, 3))
+    ax = fig.subplots()
+    ax.bar(by_gender.index.astype(str), by_gender.values, color="#4c72b0")
+    ax.set_ylabel("ECL")
+    ax.set_xlabel("Gender")
+    ax.set_title("ECL by Gender")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+
+def build_view(df: pd.DataFrame, sel_intent, sel_gender) -> dict | None:
+    f = df[df["loan_intent"].isin(sel_intent) & df["person_gender"].isin(sel_gender)]
+    if f.empty:
+        return None
+    g, med = aggregate(f)
+    return {
+        "summary": g,
+        "median": med,
+        "chart_png": _render_gender_chart(f),
+    }